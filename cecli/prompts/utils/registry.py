@@ -10,11 +10,24 @@ This module implements a YAML-based prompt inheritance system where:
 6. Circular dependencies are detected and prevented
 """
 
-from typing import Any, Dict, List, Optional
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 import importlib_resources
 import yaml
 
+from cecli.helpers.file_searcher import handle_core_files
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # libyaml not available
+    from yaml import SafeLoader as _YamlLoader
+
+# JSON file holding all packaged prompts, already merged, in the user's cache dir
+MERGED_CACHE_FILE = "prompts.merged.json"
+
 
 class PromptObject:
     def __init__(self, prompts_dict):
@@ -28,29 +41,26 @@ class PromptRegistry:
     # Class-level state for singleton pattern
     _prompts_cache: Dict[str, Dict[str, Any]] = {}
     _base_prompts: Optional[Dict[str, Any]] = None
+    _yaml_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+    _merged_prompts: Optional[Dict[str, Dict[str, Any]]] = None
+    _available_prompts: Optional[Tuple[Optional[int], List[str]]] = None
+    # Overrides the merged prompts cache location (used by tests)
+    _merged_cache_file: Optional[Path] = None
 
-    @staticmethod
-    def _load_yaml_file(file_name: str) -> Dict[str, Any]:
+    @classmethod
+    def _load_yaml_file(cls, file_name: str) -> Dict[str, Any]:
         """Load a YAML file and return its contents."""
         try:
             # Use importlib_resources to access package files
-            file_content = (
-                importlib_resources.files("cecli.prompts")
-                .joinpath(file_name)
-                .read_text(encoding="utf-8")
-            )
-            return yaml.safe_load(file_content) or {}
+            resource = importlib_resources.files("cecli.prompts").joinpath(file_name)
+            return cls._load_yaml_resource(resource)
         except FileNotFoundError:
             # If not found via importlib_resources, try local file system
             # Treat file_name as absolute path relative to current working directory
             try:
-                import os
-
                 file_path = os.path.abspath(file_name)
                 if os.path.exists(file_path):
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        file_content = f.read()
-                    return yaml.safe_load(file_content) or {}
+                    return cls._load_yaml_resource(Path(file_path))
                 else:
                     raise ValueError(f"Prompt YAML file not found {file_name}")
             except (FileNotFoundError, OSError) as e:
@@ -58,6 +68,64 @@ class PromptRegistry:
         except yaml.YAMLError as e:
             raise ValueError(f"Error parsing YAML file {file_name}: {e}")
 
+    @classmethod
+    def _load_yaml_resource(cls, resource) -> Dict[str, Any]:
+        """
+        Parse a YAML resource, reusing the previous parse while its mtime is unchanged.
+
+        Resolving an inheritance chain and merging it both read the same files, so
+        each file is only parsed once per process unless it is edited on disk.
+        """
+        try:
+            mtime = os.stat(resource).st_mtime_ns
+        except TypeError:
+            # Not backed by a real file (e.g. zipped package), parse without caching
+            mtime = None
+
+        key = str(resource)
+        cached = cls._yaml_cache.get(key)
+        if mtime is not None and cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        data = yaml.load(resource.read_text(encoding="utf-8"), Loader=_YamlLoader) or {}
+        if mtime is not None:
+            cls._yaml_cache[key] = (mtime, data)
+        return data
+
+    @staticmethod
+    def _disk_cache_enabled() -> bool:
+        """The on-disk merged prompts cache can be disabled with CECLI_NO_PROMPT_CACHE=1."""
+        return os.environ.get("CECLI_NO_PROMPT_CACHE", "").lower() not in ("1", "true", "yes")
+
+    @staticmethod
+    def _read_json_cache(cache_path: Path, stamp: Any) -> Optional[Any]:
+        """Return the data cached at cache_path if it was written for this stamp."""
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            # Missing, unreadable or corrupt cache files are simply rebuilt
+            return None
+        if not isinstance(cached, dict) or cached.get("stamp") != stamp:
+            return None
+        return cached.get("data")
+
+    @staticmethod
+    def _write_json_cache(cache_path: Path, stamp: Any, data: Any) -> None:
+        """Atomically write stamp and data to cache_path, ignoring failures."""
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            # Created with the default umask so other users can read a shared cache
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"stamp": stamp, "data": data}, f)
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError, ValueError):
+            # Unwritable location, or prompts holding values JSON can't represent
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
     @classmethod
     def _get_base_prompts(cls) -> Dict[str, Any]:
         """Load and cache base.yml prompts."""
@@ -67,12 +135,18 @@ class PromptRegistry:
 
     @staticmethod
     def _merge_prompts(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
-        """Recursively merge override dict into base dict."""
-        result = base.copy()
+        """
+        Recursively merge override dict into base dict.
+
+        Only the top-level dict and nested dicts present in both inputs are copied;
+        everything else is shared with the inputs rather than duplicated.
+        """
+        result = {**base}
 
         for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = PromptRegistry._merge_prompts(result[key], value)
+            base_value = result.get(key)
+            if isinstance(base_value, dict) and isinstance(value, dict):
+                result[key] = PromptRegistry._merge_prompts(base_value, value)
             else:
                 result[key] = value
 
@@ -115,8 +189,6 @@ class PromptRegistry:
             # If not found via importlib_resources, try local file system
             # Treat file_name as absolute path relative to current working directory
             try:
-                import os
-
                 prompt_file_name = os.path.abspath(prompt_file_name)
                 if os.path.exists(prompt_file_name):
                     pass
@@ -159,6 +231,19 @@ class PromptRegistry:
         if prompt_name in cls._prompts_cache:
             return cls._prompts_cache[prompt_name]
 
+        # Packaged prompts come pre-merged from the on-disk cache when possible
+        merged_prompts = cls._get_merged_prompts().get(prompt_name)
+        if merged_prompts is None:
+            merged_prompts = cls._build_prompt(prompt_name)
+
+        # Cache the result
+        cls._prompts_cache[prompt_name] = merged_prompts
+
+        return merged_prompts
+
+    @classmethod
+    def _build_prompt(cls, prompt_name: str) -> Dict[str, Any]:
+        """Resolve the inheritance chain for a prompt type and merge it."""
         # Resolve inheritance chain
         inheritance_chain = cls._resolve_inheritance_chain(prompt_name)
 
@@ -178,25 +263,105 @@ class PromptRegistry:
         # Remove _inherits key from final result (it's metadata, not a prompt)
         merged_prompts.pop("_inherits", None)
 
-        # Cache the result
-        cls._prompts_cache[prompt_name] = merged_prompts
-
         return merged_prompts
 
+    @classmethod
+    def _get_merged_prompts(cls) -> Dict[str, Dict[str, Any]]:
+        """
+        Load every packaged prompt type, already merged, from a single JSON cache.
+
+        The cache lives in the user's cache dir and is stamped with the prompts
+        directory and the name and mtime of each YAML file in it, so it is rebuilt
+        whenever any of them changes. When the cache can't be written, prompts are
+        merged on demand instead of building all of them on every start.
+        """
+        if cls._merged_prompts is not None:
+            return cls._merged_prompts
+
+        cls._merged_prompts = {}
+        if not cls._disk_cache_enabled():
+            return cls._merged_prompts
+
+        try:
+            prompts_dir = os.fspath(importlib_resources.files("cecli.prompts"))
+            with os.scandir(prompts_dir) as entries:
+                manifest = sorted(
+                    [entry.name, entry.stat().st_mtime_ns]
+                    for entry in entries
+                    if entry.name.endswith(".yml") and entry.is_file()
+                )
+        except (TypeError, OSError):
+            # Not a real directory (e.g. zipped package), merge on demand instead
+            return cls._merged_prompts
+
+        stamp = [prompts_dir, manifest]
+        cache_path = cls._merged_cache_path()
+        merged = cls._read_json_cache(cache_path, stamp)
+        if merged is None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+            except OSError:
+                return cls._merged_prompts
+            if not os.access(cache_path.parent, os.W_OK):
+                return cls._merged_prompts
+
+            merged = {}
+            for file_name, _ in manifest:
+                prompt_name = file_name[: -len(".yml")]
+                try:
+                    merged[prompt_name] = cls._build_prompt(prompt_name)
+                except (ValueError, FileNotFoundError):
+                    # Leave broken prompts out so get_prompt reports the error itself
+                    continue
+            cls._write_json_cache(cache_path, stamp, merged)
+
+        cls._merged_prompts = merged
+        return merged
+
+    @classmethod
+    def _merged_cache_path(cls) -> Path:
+        """Location of the merged prompts cache."""
+        if cls._merged_cache_file is not None:
+            return cls._merged_cache_file
+        return Path(handle_core_files(Path.home() / ".cecli" / "caches")) / MERGED_CACHE_FILE
+
     @classmethod
     def reload_prompts(cls):
         """Clear cache and reload all prompts from disk."""
         cls._prompts_cache.clear()
         cls._base_prompts = None
+        cls._yaml_cache.clear()
+        cls._merged_prompts = None
+        cls._available_prompts = None
 
-    @staticmethod
-    def list_available_prompts() -> list[str]:
+    @classmethod
+    def list_available_prompts(cls) -> list[str]:
         """List all available prompt types."""
-        prompts = []
-        for path in importlib_resources.files("cecli.prompts").iterdir():
-            if path.is_file() and path.name.endswith(".yml") and path.name != "base.yml":
-                prompts.append(path.stem)
-        return sorted(prompts)
+        prompts_dir = importlib_resources.files("cecli.prompts")
+        try:
+            prompts_dir = os.fspath(prompts_dir)
+            mtime = os.stat(prompts_dir).st_mtime_ns
+        except TypeError:
+            # Not a real directory (e.g. zipped package), so its contents can't change
+            mtime = None
+
+        # Adding or removing a prompt file bumps the directory mtime
+        if cls._available_prompts is not None and cls._available_prompts[0] == mtime:
+            return list(cls._available_prompts[1])
+
+        if mtime is None:
+            entries = list(prompts_dir.iterdir())
+        else:
+            with os.scandir(prompts_dir) as it:
+                entries = list(it)
+
+        prompts = sorted(
+            entry.name[: -len(".yml")]
+            for entry in entries
+            if entry.name.endswith(".yml") and entry.name != "base.yml" and entry.is_file()
+        )
+        cls._available_prompts = (mtime, prompts)
+        return list(prompts)
 
 
 # All methods are static/class methods, so no instance is needed
@@ -66,6 +66,8 @@ class CompletionBar(Widget, can_focus=False):
     class Selected(Message):
         """Completion selected message."""
 
+        __slots__ = ("value",)
+
         def __init__(self, value: str):
             self.value = value
             super().__init__()
@@ -73,7 +75,7 @@ class CompletionBar(Widget, can_focus=False):
     class Dismissed(Message):
         """Completion bar dismissed."""
 
-        pass
+        __slots__ = ()
 
     def __init__(self, suggestions: list[str] = None, prefix: str = "", **kwargs):
         """Initialize completion bar.
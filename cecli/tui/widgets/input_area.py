@@ -1,9 +1,17 @@
 """Input widget for cecli TUI."""
 
+import datetime
+from itertools import islice
+
 from prompt_toolkit.history import FileHistory
 from textual.message import Message
 from textual.widgets import TextArea
 
+# Seconds to wait after a submit before appending pending entries to the history file
+HISTORY_FLUSH_DELAY = 1.0
+# Most recent history entries kept in memory for up/down navigation
+HISTORY_MAX_ENTRIES = 5000
+
 
 class InputArea(TextArea):
     """Input widget with autocomplete and history support."""
@@ -11,6 +19,8 @@ class InputArea(TextArea):
     class Submit(Message):
         """User submitted the input (Enter key)."""
 
+        __slots__ = ("value",)
+
         def __init__(self, value: str):
             self.value = value
             super().__init__()
@@ -18,6 +28,8 @@ class InputArea(TextArea):
     class CompletionRequested(Message):
         """User requested completion (Tab key or auto-trigger)."""
 
+        __slots__ = ("text",)
+
         def __init__(self, text: str):
             self.text = text
             super().__init__()
@@ -25,22 +37,22 @@ class InputArea(TextArea):
     class CompletionCycle(Message):
         """User wants to cycle through completions."""
 
-        pass
+        __slots__ = ()
 
     class CompletionCyclePrevious(Message):
         """User wants to cycle through completions backwards."""
 
-        pass
+        __slots__ = ()
 
     class CompletionAccept(Message):
         """User wants to accept current completion."""
 
-        pass
+        __slots__ = ()
 
     class CompletionDismiss(Message):
         """User wants to dismiss completions."""
 
-        pass
+        __slots__ = ()
 
     def __init__(self, history_file: str = None, **kwargs):
         """Initialize input area.
@@ -78,6 +90,8 @@ class InputArea(TextArea):
         self._history: list[str] | None = None  # None = not loaded yet
         self._history_index = -1  # -1 = not navigating, 0+ = position in history
         self._saved_input = ""  # Saves current input when navigating history
+        self._pending_history: list[str] = []  # Formatted entries not yet written to disk
+        self._history_flush_timer = None
 
     @property
     def value(self) -> str:
@@ -129,10 +143,16 @@ class InputArea(TextArea):
             self._history = []
             if self.history_file:
                 try:
-                    # FileHistory returns most recent first, so reverse it
-                    self._history = list(
-                        reversed(list(FileHistory(self.history_file).load_history_strings()))
+                    # FileHistory returns most recent first, so keep the newest
+                    # entries and reverse them in place
+                    history = list(
+                        islice(
+                            FileHistory(self.history_file).load_history_strings(),
+                            HISTORY_MAX_ENTRIES,
+                        )
                     )
+                    history.reverse()
+                    self._history = history
                 except (OSError, IOError):
                     pass  # History file doesn't exist yet or can't be read
         return self._history
@@ -162,12 +182,14 @@ class InputArea(TextArea):
         if history and history[-1] == text:
             return
 
-        # Save to file
+        # Queue for the history file, written in one batch by _flush_history
         if self.history_file:
-            try:
-                FileHistory(self.history_file).append_string(text)
-            except (OSError, IOError):
-                pass
+            # Same on-disk format as prompt_toolkit's FileHistory.store_string
+            entry = f"\n# {datetime.datetime.now()}\n"
+            entry += "".join(f"+{line}\n" for line in text.split("\n"))
+            self._pending_history.append(entry)
+            if self._history_flush_timer is None:
+                self._history_flush_timer = self.set_timer(HISTORY_FLUSH_DELAY, self._flush_history)
 
         # Add to in-memory history
         history.append(text)
@@ -176,6 +198,27 @@ class InputArea(TextArea):
         self._history_index = -1
         self._saved_input = ""
 
+    def _flush_history(self) -> None:
+        """Append all pending history entries to the history file with a single write."""
+        if self._history_flush_timer is not None:
+            self._history_flush_timer.stop()
+            self._history_flush_timer = None
+
+        if not self._pending_history:
+            return
+
+        data = "".join(self._pending_history)
+        self._pending_history = []
+        try:
+            with open(self.history_file, "ab") as f:
+                f.write(data.encode("utf-8"))
+        except (OSError, IOError):
+            pass
+
+    def on_unmount(self) -> None:
+        """Write out any history still pending when the widget goes away."""
+        self._flush_history()
+
     def _history_prev(self) -> None:
         """Navigate to previous (older) history entry."""
         history = self._ensure_history_loaded()
@@ -302,19 +345,24 @@ class InputArea(TextArea):
         if self._cycling:
             return
 
-        self._completion_prefix = self.text
+        val = self.text
+        self._completion_prefix = val
 
-        if not self.disabled:
-            val = self.text
-            possible_path = False
+        # Auto-trigger for slash commands, @ symbols, or update existing completions
+        if self.completion_active or self._triggers_completion(val):
+            self.post_message(self.CompletionRequested(val))
 
-            # Auto-trigger for slash commands, @ symbols, or update existing completions
-            words = val.rsplit(maxsplit=1)
+    @staticmethod
+    def _triggers_completion(val: str) -> bool:
+        """Whether typed text should open completions, checked cheapest test first."""
+        if not val:
+            return False
 
-            if words:
-                last_word = words[-1]
-                if "/" in last_word:
-                    possible_path = True
+        if val[0] == "/" or "@" in val:
+            return True
 
-            if val.startswith("/") or "@" in val or possible_path or self.completion_active:
-                self.post_message(self.CompletionRequested(val))
+        # Possible path: a "/" inside the last word
+        if "/" not in val:
+            return False
+        words = val.rsplit(maxsplit=1)
+        return bool(words) and "/" in words[-1]
@@ -11,10 +11,20 @@ from textual import events, on
 from textual.message import Message
 from textual.widgets import RichLog
 
+# How long streamed chunks are coalesced before being written (about one frame)
+STREAM_FLUSH_INTERVAL = 0.016
+
+# Session cost reported in tool output, e.g. "$0.0123 session"
+_COST_RE = re.compile(r"\$(\d+\.?\d*)\s*session")
+# Leading "name:" of a tool call argument line
+_TOOL_ARG_RE = re.compile(r"(^\S+:)")
+
 
 class CostUpdate(Message):
     """Message to update cost in footer."""
 
+    __slots__ = ("cost",)
+
     def __init__(self, cost: float):
         self.cost = cost
         super().__init__()
@@ -42,6 +52,9 @@ class OutputContainer(RichLog):
         super().__init__(**kwargs)
         # Line buffer for streaming text to avoid word-per-line issue
         self._line_buffer = ""
+        # Chunks received since the last flush, written together by _flush_pending
+        self._pending_text = ""
+        self._flush_timer = None
         # Track if we're on the first line of the current response
         self._first_line_of_response = True
 
@@ -83,19 +96,42 @@ class OutputContainer(RichLog):
         return wrapped_text
 
     async def stream_chunk(self, text: str):
-        """Stream a chunk of markdown text."""
+        """Stream a chunk of markdown text.
+
+        Chunks are coalesced and written at most once per STREAM_FLUSH_INTERVAL,
+        so fast token streams don't trigger a write per token.
+        """
         if not text:
             return
 
         # Check for cost updates in the text
         self._check_cost(text)
 
-        # Add text to line buffer
-        self._line_buffer += text
+        self._pending_text += text
+        if self._flush_timer is None:
+            self._flush_timer = self.set_timer(STREAM_FLUSH_INTERVAL, self._flush_pending)
+
+    def _flush_pending(self):
+        """Write out streamed chunks accumulated since the last flush."""
+        if self._flush_timer is not None:
+            self._flush_timer.stop()
+            self._flush_timer = None
+
+        if not self._pending_text:
+            return
+
+        text = self._pending_text
+        self._pending_text = ""
+
+        # Only the new text can complete a line, so long lines aren't rescanned
+        if "\n" not in text:
+            self._line_buffer += text
+            return
+
+        # Split out all complete lines in one pass, keeping the partial last line
+        *lines, self._line_buffer = (self._line_buffer + text).split("\n")
 
-        # Process complete lines from buffer
-        while "\n" in self._line_buffer:
-            line, self._line_buffer = self._line_buffer.split("\n", 1)
+        for line in lines:
             if line.rstrip():
                 self.set_last_write_type("assistant")
                 # Format with prefix on first line, proper indentation on subsequent lines
@@ -118,6 +154,8 @@ class OutputContainer(RichLog):
 
     async def _stop_stream(self):
         """Stop the current markdown stream."""
+        self._flush_pending()
+
         # Flush any remaining buffer content
         if self._line_buffer.rstrip():
             # Format remaining content based on whether it's first line or not
@@ -142,11 +180,15 @@ class OutputContainer(RichLog):
         wrapped_text = self._wrap_text_with_prefix(text, prefix="> ")
 
         # Output each wrapped line with green styling
+        wrote = False
         for line in wrapped_text.split("\n"):
             if line.strip():
                 self.output(f"[bold medium_spring_green]{line}[/bold medium_spring_green]")
+                wrote = True
 
-        self.scroll_end(animate=False)
+        # With auto_scroll on, every write already scrolls to the end
+        if not wrote:
+            self.scroll_end(animate=False)
 
     def add_system_message(self, text: str, dim=True):
         """Add a system/tool message."""
@@ -213,7 +255,7 @@ class OutputContainer(RichLog):
                 self.output(Padding(Text(clean_line, style="dim bright_cyan"), (0, 0, 0, 2)))
             else:
                 # Subsequent lines (arguments) - prefix with corner to show they belong to the call
-                arg_string_list = re.split(r"(^\S+:)", clean_line, maxsplit=1)[1:]
+                arg_string_list = _TOOL_ARG_RE.split(clean_line, maxsplit=1)[1:]
 
                 if len(arg_string_list) > 1:
                     tool_property = arg_string_list[0].replace("_", " ").title()
@@ -246,7 +288,11 @@ class OutputContainer(RichLog):
 
     def _check_cost(self, text: str):
         """Extract and emit cost updates."""
-        match = re.search(r"\$(\d+\.?\d*)\s*session", text)
+        # Most chunks can't contain a cost, skip the regex for them
+        if "$" not in text or "session" not in text:
+            return
+
+        match = _COST_RE.search(text)
         if match:
             try:
                 self.post_message(CostUpdate(float(match.group(1))))
@@ -259,10 +305,18 @@ class OutputContainer(RichLog):
 
     def clear_output(self):
         """Clear all output."""
+        if self._flush_timer is not None:
+            self._flush_timer.stop()
+            self._flush_timer = None
+        self._pending_text = ""
         self._line_buffer = ""
         self.clear()
 
     def set_last_write_type(self, type):
+        # Streamed text that is still pending was received before this write
+        if self._pending_text:
+            self._flush_pending()
+
         if type and self._last_write_type and self._last_write_type != type:
             self.output("")
 
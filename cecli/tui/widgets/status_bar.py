@@ -118,6 +118,8 @@ class StatusBar(Widget, can_focus=True):
     class ConfirmResponse(Message):
         """Confirmation response message."""
 
+        __slots__ = ("result",)
+
         def __init__(self, result: bool | str):
             self.result = result
             super().__init__()
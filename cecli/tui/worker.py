@@ -12,9 +12,12 @@ from cecli.commands import SwitchCoderSignal
 # Suppress asyncio task destroyed warnings during shutdown
 logging.getLogger("asyncio").setLevel(logging.CRITICAL)
 
-# Also suppress via warnings module
+# Also suppress via warnings module. These stay process-wide: warnings state is
+# global, and coroutines can be garbage collected after the worker has exited.
 warnings.filterwarnings("ignore", message=".*Task was destroyed.*")
-warnings.filterwarnings("ignore", message=".*coroutine.*was never awaited.*")
+warnings.filterwarnings(
+    "ignore", category=RuntimeWarning, message=".*coroutine.*was never awaited.*"
+)
 
 
 class CoderWorker:
@@ -62,24 +65,24 @@ class CoderWorker:
             return
 
         try:
-            # Cancel pending tasks if loop is still running
-            if not self.loop.is_closed():
-                pending = asyncio.all_tasks(self.loop)
-                for task in pending:
-                    task.cancel()
-
-                # Only try to gather if loop isn't stopped
-                if self.loop.is_running():
-                    pass  # Can't do much if loop is still running
-                elif pending:
-                    try:
-                        self.loop.run_until_complete(
-                            asyncio.gather(*pending, return_exceptions=True)
-                        )
-                    except RuntimeError:
-                        pass  # Loop already stopped
-
-                self.loop.close()
+            # Nothing can be driven to completion on a loop that is still running
+            if self.loop.is_closed() or self.loop.is_running():
+                return
+
+            # Cancel pending tasks so their cleanup code runs, as asyncio.run() does
+            pending = asyncio.all_tasks(self.loop)
+            for task in pending:
+                task.cancel()
+
+            try:
+                if pending:
+                    self.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+                # Finalize async generators (e.g. interrupted LLM streams) before closing
+                self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+            except RuntimeError:
+                pass  # Loop already stopped
+
+            self.loop.close()
         except Exception:
             pass  # Ignore cleanup errors
 
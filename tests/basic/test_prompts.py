@@ -20,6 +20,12 @@ import yaml
 from cecli.prompts.utils.registry import PromptRegistry
 
 
+@pytest.fixture(autouse=True)
+def no_prompt_disk_cache(monkeypatch):
+    """Keep tests from reading or writing the user's merged prompts cache."""
+    monkeypatch.setenv("CECLI_NO_PROMPT_CACHE", "1")
+
+
 class TestPromptRegistry:
     """Test suite for PromptRegistry class."""
 
@@ -28,6 +34,9 @@ class TestPromptRegistry:
         # Clear class-level state for each test
         PromptRegistry._prompts_cache = {}
         PromptRegistry._base_prompts = None
+        PromptRegistry._yaml_cache = {}
+        PromptRegistry._merged_prompts = None
+        PromptRegistry._available_prompts = None
 
     def test_singleton_pattern(self):
         """Test that PromptRegistry follows singleton pattern."""
@@ -82,6 +91,27 @@ class TestPromptRegistry:
         finally:
             os.unlink(temp_path)
 
+    def test_load_yaml_file_cached_until_modified(self):
+        """Test that parsed YAML is reused until the file's mtime changes."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
+            yaml.dump({"test_key": "test_value"}, f)
+            temp_path = f.name
+
+        try:
+            first = PromptRegistry._load_yaml_file(Path(temp_path))
+            second = PromptRegistry._load_yaml_file(Path(temp_path))
+            assert first is second
+
+            with open(temp_path, "w") as f:
+                yaml.dump({"test_key": "new_value"}, f)
+            stat = os.stat(temp_path)
+            os.utime(temp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+            third = PromptRegistry._load_yaml_file(Path(temp_path))
+            assert third == {"test_key": "new_value"}
+        finally:
+            os.unlink(temp_path)
+
     def test_merge_prompts_simple(self):
         """Test simple dictionary merging."""
         base = {"key1": "value1", "key2": "value2"}
@@ -300,6 +330,46 @@ class TestPromptRegistry:
         assert len(PromptRegistry._prompts_cache) == 1
         assert prompts1 is prompts2  # Same object from cache
 
+    def test_get_prompt_uses_merged_cache(self, monkeypatch, tmp_path):
+        """Test that packaged prompts are served pre-merged from the on-disk cache."""
+        monkeypatch.delenv("CECLI_NO_PROMPT_CACHE")
+        cache_file = tmp_path / "prompts.merged.json"
+        monkeypatch.setattr(PromptRegistry, "_merged_cache_file", cache_file)
+
+        merged = PromptRegistry._get_merged_prompts()
+        assert merged["patch"] == PromptRegistry._build_prompt("patch")
+        assert cache_file.exists()
+
+        # A fresh process loads the merged prompts without merging anything
+        PromptRegistry.reload_prompts()
+
+        def fail_build(prompt_name):
+            raise AssertionError(f"{prompt_name} should come from the merged cache")
+
+        monkeypatch.setattr(PromptRegistry, "_build_prompt", fail_build)
+        prompts = PromptRegistry.get_prompt("patch")
+        assert "V4A Diff Format" in prompts["system_reminder"]
+
+    def test_get_prompt_unwritable_merged_cache(self, monkeypatch, tmp_path):
+        """Test that only the requested prompt is merged when the cache can't be written."""
+        monkeypatch.delenv("CECLI_NO_PROMPT_CACHE")
+        cache_file = tmp_path / "prompts.merged.json"
+        monkeypatch.setattr(PromptRegistry, "_merged_cache_file", cache_file)
+        monkeypatch.setattr(os, "access", lambda path, mode: False)
+
+        built = []
+        original_build = PromptRegistry._build_prompt
+
+        def counting_build(prompt_name):
+            built.append(prompt_name)
+            return original_build(prompt_name)
+
+        monkeypatch.setattr(PromptRegistry, "_build_prompt", counting_build)
+        prompts = PromptRegistry.get_prompt("patch")
+        assert "V4A Diff Format" in prompts["system_reminder"]
+        assert built == ["patch"]
+        assert not cache_file.exists()
+
     def test_get_prompt_removes_inherits_key(self):
         """Test that _inherits key is removed from final prompts."""
         # Test with a few different prompt types
@@ -318,6 +388,8 @@ class TestPromptRegistry:
         PromptRegistry.reload_prompts()
         assert len(PromptRegistry._prompts_cache) == 0
         assert PromptRegistry._base_prompts is None
+        assert len(PromptRegistry._yaml_cache) == 0
+        assert PromptRegistry._merged_prompts is None
 
     def test_list_available_prompts(self):
         """Test listing available prompts."""
@@ -329,6 +401,42 @@ class TestPromptRegistry:
         assert "base" not in prompts  # base.yml should be excluded
         assert all(isinstance(p, str) for p in prompts)
 
+    def test_list_available_prompts_cached_by_dir_mtime(self):
+        """Test that the prompt listing is reused until the directory mtime changes."""
+        prompts = PromptRegistry.list_available_prompts()
+        mtime, cached = PromptRegistry._available_prompts
+        assert cached == prompts
+
+        PromptRegistry._available_prompts = (mtime, ["cached_only"])
+        assert PromptRegistry.list_available_prompts() == ["cached_only"]
+
+        PromptRegistry._available_prompts = (mtime - 1, ["cached_only"])
+        assert PromptRegistry.list_available_prompts() == prompts
+
+    def test_list_available_prompts_non_filesystem_package(self, monkeypatch):
+        """Test that prompts in a non-filesystem package are listed once and cached."""
+        import importlib_resources
+
+        calls = []
+
+        class MockEntry:
+            def __init__(self, name):
+                self.name = name
+
+            def is_file(self):
+                return True
+
+        class MockPackage:
+            def iterdir(self):
+                calls.append(1)
+                return [MockEntry(n) for n in ["base.yml", "b.yml", "a.yml", "README.md"]]
+
+        monkeypatch.setattr(importlib_resources, "files", lambda package: MockPackage())
+
+        assert PromptRegistry.list_available_prompts() == ["a", "b"]
+        assert PromptRegistry.list_available_prompts() == ["a", "b"]
+        assert len(calls) == 1
+
     def test_inheritance_chain_real_example(self):
         """Test a real inheritance chain from the actual YAML files."""
         # Test editor_diff_fenced which has a deep inheritance chain